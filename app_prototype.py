@@ -5,6 +5,10 @@ import plotly.graph_objects as go
 import numpy as np
 import os
 import io
+import threading
+import time
+from collections import OrderedDict, deque, namedtuple
+from concurrent.futures import Future, ThreadPoolExecutor
 
 def add_cohesive_climate_style():
     st.markdown(
@@ -64,12 +68,103 @@ st.set_page_config(layout="wide", page_title="ClimateScope Prototype")
 st.title("🌍 Global Weather Monitor")
 
 DATA_PATH = "data/processed/monthly_agg.parquet"
+EXTREMES_PATH = "analysis/extremes.csv"
+TRENDS_PATH = "data/processed/trends.parquet"
+TREND_SEASONS = ["ANN", "DJF", "MAM", "JJA", "SON"]
 REQUIRED_COLS = ["country", "year", "month", "temperature_celsius", "precip_mm", "humidity", "wind_mps"]
-
-if not os.path.exists(DATA_PATH):
-    st.warning("Run scripts/aggregate_daily_to_monthly.py first to generate data.")
-else:
-    df = pd.read_parquet(DATA_PATH)
+DERIVED_COLS = ["month_num", "date"]
+YEAR_BOUNDS = (2000, 2025)
+CHART_TYPES = ["Line", "Bar", "Heatmap"]
+
+# Rendered figures kept per dataset, and the workers that warm them in the
+# background after each render. Filtered rows and CSV exports are rebuilt on
+# demand rather than cached, since they are cheap to rebuild but large to hold.
+RESULT_CACHE_SIZE = 64
+PREFETCH_WORKERS = 2
+# Drill-down is only prefetched for the first few selected countries, keeping a
+# render's speculative work to about a dozen candidates.
+PREFETCH_DRILL_COUNTRIES = 3
+# Exact refinements of an on-screen preview get their own workers so they never
+# queue behind speculative prefetch work.
+REFINE_WORKERS = 2
+
+# Plotly Express spends ~3 ms per country trace building the trend and time
+# series charts, independent of points per trace. Selections drawing at least
+# this many countries first render a cross-country summary of each, then
+# refine to the per-country charts.
+APPROX_MIN_TRACES = 50
+APPROX_BAND = (0.05, 0.95)
+APPROX_POLL_SECONDS = 0.25
+
+# Sidebar filter state; hashable so it can key the result cache.
+Selection = namedtuple("Selection", ["yr_range", "countries", "date_bounds", "drill_year", "drill_country"])
+
+
+class ResultCache:
+    """Bounded LRU store shared by the page render and the prefetch workers.
+
+    A key that is still being computed maps to a Future, so a second caller
+    waits for that result instead of building the same figure again. Entries
+    written speculatively are evicted before anything a render has used.
+    """
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._in_flight = {}
+        self._speculative = set()
+        self._lock = threading.Lock()
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._entries
+
+    def get_or_compute(self, key, compute, speculative=False):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                if not speculative:
+                    self._speculative.discard(key)
+                return self._entries[key]
+            pending = self._in_flight.get(key)
+            owner = pending is None
+            if owner:
+                pending = self._in_flight[key] = Future()
+        if not owner:
+            value = pending.result()
+            if not speculative:
+                with self._lock:
+                    self._speculative.discard(key)
+            return value
+        try:
+            value = compute()
+        except BaseException as exc:
+            with self._lock:
+                del self._in_flight[key]
+            pending.set_exception(exc)
+            raise
+        with self._lock:
+            del self._in_flight[key]
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if speculative:
+                self._speculative.add(key)
+            self._evict()
+        pending.set_result(value)
+        return value
+
+    def _evict(self):
+        while len(self._entries) > self.max_entries:
+            victim = next((key for key in self._entries if key in self._speculative), None)
+            if victim is None:
+                victim = next(iter(self._entries))
+            del self._entries[victim]
+            self._speculative.discard(victim)
+
+
+@st.cache_resource(max_entries=1)
+def load_monthly(path, mtime):
+    df = pd.read_parquet(path)
     np.random.seed(42)
     demo_cols = [
         ("pressure_hPa", 980, 1040),
@@ -87,11 +182,351 @@ else:
         if col not in df.columns:
             df[col] = np.random.uniform(mn, mx, len(df))
 
+    # --- BUILD DATE COLUMN ON FULL DF (for filtering) ---
+    if "year" in df.columns and "month" in df.columns:
+        df["month_num"] = pd.to_datetime(df["month"], errors="coerce").dt.month
+        df["date"] = pd.to_datetime(
+            df["year"].astype(str) + "-" + df["month_num"].astype(str) + "-01"
+        )
+    return df
+
+
+@st.cache_resource
+def load_trends(path, mtime):
+    return pd.read_parquet(path)
+
+
+def build_trend_map(trends, variable, season):
+    fig = px.choropleth(
+        trends,
+        locations="country",
+        locationmode="country names",
+        color="sens_slope",
+        color_continuous_scale="RdBu_r",
+        color_continuous_midpoint=0,
+        hover_data=["ols_slope", "mk_p", "trend", "start_year", "end_year"],
+        title=f"{variable} Sen's Slope per Year ({season})",
+        template="plotly_dark",
+    )
+    fig.update_layout(
+        paper_bgcolor="rgba(0,0,0,0)",
+        plot_bgcolor="rgba(0,0,0,0)",
+        coloraxis_colorbar=dict(title="Change / year"),
+        height=600,
+        width=1100,
+    )
+    return fig
+
+
+@st.cache_resource(max_entries=1)
+def result_cache(data_version):
+    return ResultCache(RESULT_CACHE_SIZE)
+
+
+@st.cache_resource
+def prefetch_pool():
+    return ThreadPoolExecutor(max_workers=PREFETCH_WORKERS, thread_name_prefix="prefetch")
+
+
+@st.cache_resource
+def refine_pool():
+    return ThreadPoolExecutor(max_workers=REFINE_WORKERS, thread_name_prefix="refine")
+
+
+def select_rows(df, sel):
+    rows = df[(df["year"] >= sel.yr_range[0]) & (df["year"] <= sel.yr_range[1])]
+    if sel.countries:
+        rows = rows[rows["country"].isin(sel.countries)]
+    if sel.date_bounds is not None:
+        rows = rows[(rows["date"] >= sel.date_bounds[0]) & (rows["date"] <= sel.date_bounds[1])]
+    if sel.drill_year is not None:
+        rows = rows[rows["year"] == sel.drill_year]
+    if sel.drill_country is not None:
+        rows = rows[rows["country"] == sel.drill_country]
+    return rows
+
+
+def select_extremes(ex, sel):
+    table = ex[(ex["year"] >= sel.yr_range[0]) & (ex["year"] <= sel.yr_range[1])]
+    if sel.countries:
+        table = table[table["country"].isin(sel.countries)]
+    if sel.drill_year is not None:
+        table = table[table["year"] == sel.drill_year]
+    if sel.drill_country is not None:
+        table = table[table["country"] == sel.drill_country]
+    return table
+
+
+def default_date_bounds(df, yr_range, countries):
+    base = select_rows(df, Selection(yr_range, countries, None, None, None))
+    if base.empty:
+        return None
+    return (base["date"].min(), base["date"].max())
+
+
+def build_choropleth(country_avg, variable):
+    fig = px.choropleth(
+        country_avg,
+        locations="country",
+        locationmode="country names",
+        color=variable,
+        title=f"{variable} Average by Country",
+        template="plotly_dark",
+    )
+    fig.update_layout(
+        paper_bgcolor="rgba(0,0,0,0)",
+        plot_bgcolor="rgba(0,0,0,0)",
+        coloraxis_colorbar=dict(title=variable.replace("_", " ").title()),
+        height=600,
+        width=1100,
+    )
+    return fig
+
+
+def choropleth_figure(df, cache, sel, variable, speculative=False):
+    def compute():
+        filtered = select_rows(df, sel)
+        country_avg = filtered.groupby("country")[variable].mean().reset_index()
+        return build_choropleth(country_avg, variable)
+
+    return cache.get_or_compute(("choropleth", sel, variable), compute, speculative)
+
+
+def build_trend_figure(filtered, extremes_table, sel, variable, chart_type):
+    yr_range = sel.yr_range
+    if chart_type == "Heatmap":
+        pivot = filtered.pivot_table(
+            index="country", columns="month", values=variable, aggfunc="mean", fill_value=None
+        )
+        fig2 = px.imshow(
+            pivot,
+            labels=dict(x="Month", y="Country", color=variable),
+            aspect="auto",
+            title=f"{variable} Heatmap (Country vs Month)",
+            template="plotly_dark",
+        )
+    else:
+        if chart_type == "Line":
+            fig2 = px.line(
+                filtered,
+                x="month",
+                y=variable,
+                color="country",
+                title=f"{variable} Trend Comparison ({yr_range[0]}-{yr_range[1]})",
+                template="plotly_dark",
+            )
+        elif chart_type == "Bar":
+            fig2 = px.bar(
+                filtered,
+                x="month",
+                y=variable,
+                color="country",
+                title=f"{variable} Bar Comparison ({yr_range[0]}-{yr_range[1]})",
+                template="plotly_dark",
+            )
+
+        if extremes_table is not None and not extremes_table.empty and chart_type in ("Line", "Bar"):
+            for country in sel.countries:
+                df_ext = extremes_table[extremes_table["country"] == country]
+                if not df_ext.empty and variable in df_ext.columns:
+                    fig2.add_trace(
+                        go.Scatter(
+                            x=df_ext["month"],
+                            y=df_ext[variable],
+                            mode="markers",
+                            name=f"Extreme ({country})",
+                            marker=dict(color="red", size=12, symbol="x"),
+                            showlegend=True,
+                        )
+                    )
+
+    return fig2
+
+
+def trend_chart(df, extremes, cache, sel, variable, chart_type, speculative=False):
+    def compute():
+        extremes_table = select_extremes(extremes, sel) if extremes is not None else None
+        return build_trend_figure(select_rows(df, sel), extremes_table, sel, variable, chart_type)
+
+    return cache.get_or_compute(("trend", sel, variable, chart_type), compute, speculative)
+
+
+def trend_png(cache, fig2, sel, variable, chart_type):
+    """PNG export of the trend chart; the slowest part of a render, so cached separately."""
+
+    def compute():
+        buf = io.BytesIO()
+        fig2.write_image(buf, format="png")
+        return buf.getvalue()
+
+    return cache.get_or_compute(("png", sel, variable, chart_type), compute)
+
+
+def build_timeseries(filtered, variable):
+    return px.line(
+        filtered,
+        x="date",
+        y=variable,
+        color="country",
+        title=f"Time Series of {variable.replace('_', ' ').title()}",
+        template="plotly_dark",
+        markers=True,
+    )
+
+
+def timeseries_figure(df, cache, sel, variable, speculative=False):
+    return cache.get_or_compute(
+        ("timeseries", sel, variable), lambda: build_timeseries(select_rows(df, sel), variable), speculative
+    )
+
+
+def build_envelope_figure(filtered, x, variable, chart_type, title):
+    """Mean across countries per ``x`` value, with the APPROX_BAND percentile range
+    of countries as its error bounds. One or three traces, however many countries."""
+    grouped = filtered.groupby(x)[variable]
+    env = pd.DataFrame(
+        {"mean": grouped.mean(), "low": grouped.quantile(APPROX_BAND[0]), "high": grouped.quantile(APPROX_BAND[1])}
+    ).reset_index()
+    band_name = f"{APPROX_BAND[0]:.0%}–{APPROX_BAND[1]:.0%} of countries"
+    if chart_type == "Bar":
+        traces = [
+            go.Bar(
+                x=env[x],
+                y=env["mean"],
+                error_y=dict(type="data", symmetric=False, array=env["high"] - env["mean"], arrayminus=env["mean"] - env["low"]),
+                name=f"Mean across countries ({band_name})",
+            )
+        ]
+    else:
+        traces = [
+            go.Scatter(x=env[x], y=env["high"], mode="lines", line=dict(width=0), showlegend=False, hoverinfo="skip"),
+            go.Scatter(
+                x=env[x], y=env["low"], mode="lines", line=dict(width=0), fill="tonexty",
+                fillcolor="rgba(62,111,193,0.3)", name=band_name,
+            ),
+            go.Scatter(x=env[x], y=env["mean"], mode="lines", line=dict(color="#3e6fc1"), name="Mean across countries"),
+        ]
+    fig = go.Figure(traces)
+    fig.update_layout(title=title, template="plotly_dark", xaxis_title=x, yaxis_title=variable)
+    return fig
+
+
+def refine_figures(df, extremes, cache, sel, variable, chart_type):
+    return {
+        "trend": trend_chart(df, extremes, cache, sel, variable, chart_type),
+        "timeseries": timeseries_figure(df, cache, sel, variable),
+    }
+
+
+def exact_ready(cache, sel, variable, chart_type):
+    keys = [("trend", sel, variable, chart_type), ("timeseries", sel, variable)]
+    return all(key in cache for key in keys)
+
+
+def prefetch_candidates(sel, variable, chart_type, variable_options):
+    """Selections the user is likely to pick next: other chart types, the next
+    variable, a one-year nudge of either slider handle and drill-down into the
+    first few selected countries."""
+    candidates = [(sel, variable, other) for other in CHART_TYPES if other != chart_type]
+    next_variable = variable_options[(variable_options.index(variable) + 1) % len(variable_options)]
+    if next_variable != variable:
+        candidates.append((sel, next_variable, chart_type))
+    lo, hi = sel.yr_range
+    for new_range in ((lo - 1, hi), (lo + 1, hi), (lo, hi - 1), (lo, hi + 1)):
+        if YEAR_BOUNDS[0] <= new_range[0] <= new_range[1] <= YEAR_BOUNDS[1]:
+            # Moving the slider resets the calendar widget to its defaults.
+            candidates.append((sel._replace(yr_range=new_range, date_bounds=None), variable, chart_type))
+    if sel.drill_country is None:
+        for country in sel.countries[:PREFETCH_DRILL_COUNTRIES]:
+            candidates.append((sel._replace(drill_country=country), variable, chart_type))
+    return candidates
+
+
+def warm_selection(df, extremes, cache, stop, sel, variable, chart_type, speculative=False):
+    """Build the figures for one selection; the PNG export is left to the exact render."""
+    if stop.is_set():
+        return
+    if sel.date_bounds is None:
+        sel = sel._replace(date_bounds=default_date_bounds(df, sel.yr_range, sel.countries))
+    filtered = select_rows(df, sel)
+    steps = (
+        lambda: choropleth_figure(df, cache, sel, variable, speculative),
+        lambda: trend_chart(df, extremes, cache, sel, variable, chart_type, speculative),
+        lambda: timeseries_figure(df, cache, sel, variable, speculative),
+    )
+    for step in steps:
+        if stop.is_set() or filtered.empty:
+            return
+        step()
+
+
+def cancel_prefetch():
+    """Drop speculative work queued by the previous render; the user has moved on."""
+    stop = st.session_state.get("prefetch_stop")
+    if stop is not None:
+        stop.set()
+    for future in st.session_state.get("prefetch_futures", []):
+        future.cancel()
+    st.session_state["prefetch_futures"] = []
+
+
+def schedule_prefetch(df, extremes, cache, candidates):
+    """Warm ``candidates`` one at a time on the shared pool.
+
+    Each task resubmits the next candidate to the back of the queue, so
+    sessions take turns on the workers instead of one long queue starving
+    the others.
+    """
+    stop = threading.Event()
+    pending = deque(candidates)
+    pool = prefetch_pool()
+
+    def warm_next():
+        if stop.is_set() or not pending:
+            return
+        try:
+            warm_selection(df, extremes, cache, stop, *pending.popleft(), speculative=True)
+        finally:
+            if pending and not stop.is_set():
+                pool.submit(warm_next)
+
+    st.session_state["prefetch_stop"] = stop
+    st.session_state["prefetch_futures"] = [pool.submit(warm_next)]
+
+
+def schedule_refine(df, extremes, cache, sel, variable, chart_type):
+    future = refine_pool().submit(refine_figures, df, extremes, cache, sel, variable, chart_type)
+    st.session_state["prefetch_futures"] = [future]
+    return future
+
+
+def wait_for_exact(future, status):
+    # Updating the placeholder lets Streamlit interrupt the wait if the user reruns.
+    started = time.monotonic()
+    while not future.done():
+        status.info(
+            f"Showing a summary preview — computing per-country charts ({time.monotonic() - started:.0f}s)..."
+        )
+        time.sleep(APPROX_POLL_SECONDS)
+
+
+if not os.path.exists(DATA_PATH):
+    st.warning("Run scripts/aggregate_daily_to_monthly.py first to generate data.")
+else:
+    cancel_prefetch()
+    data_version = (
+        os.path.getmtime(DATA_PATH),
+        os.path.getmtime(EXTREMES_PATH) if os.path.exists(EXTREMES_PATH) else None,
+    )
+    df = load_monthly(DATA_PATH, data_version[0])
+    cache = result_cache(data_version)
+
     st.markdown(
         "<b>Columns present in DataFrame:</b> "
         + " ".join(
             f'<span style="display:inline-block;background:#3e6fc1;color:white;padding:4px 14px 4px 14px;border-radius:14px;margin:2px 3px;font-size:15px;">{col}</span>'
             for col in df.columns
+            if col not in DERIVED_COLS
         ),
         unsafe_allow_html=True,
     )
@@ -125,32 +560,21 @@ else:
     variable = st.sidebar.selectbox("Variable", variable_options)
 
     # --- YEAR RANGE SLIDER ---
-    yr_range = st.sidebar.slider("Year range", 2000, 2025, (int(df["year"].min()), int(df["year"].max())))
-
-    # --- BUILD DATE COLUMN ON FULL DF (for filtering) ---
-    df["month_num"] = pd.to_datetime(df["month"], errors="coerce").dt.month
-    df["date"] = pd.to_datetime(
-        df["year"].astype(str) + "-" + df["month_num"].astype(str) + "-01"
-    )
-
-    # --- FILTER YEAR RANGE FIRST ---
-    filtered = df[(df["year"] >= yr_range[0]) & (df["year"] <= yr_range[1])]
-    if sel_countries:
-        filtered = filtered[filtered["country"].isin(sel_countries)]
+    yr_range = st.sidebar.slider("Year range", YEAR_BOUNDS[0], YEAR_BOUNDS[1], (int(df["year"].min()), int(df["year"].max())))
 
     # --- DATE RANGE SIDEBAR (AFTER YEAR RANGE) ---
-    if not filtered.empty:
-        min_date = filtered["date"].min()
-        max_date = filtered["date"].max()
+    date_bounds = default_date_bounds(df, tuple(yr_range), tuple(sel_countries))
+    if date_bounds is not None:
+        min_date, max_date = date_bounds
         range_defaults = [min_date, max_date]
         date_range = st.sidebar.date_input(
             "Date range (calendar)", value=range_defaults, min_value=min_date, max_value=max_date
         )
         # For single date pick (not range) just set both to the same day:
         if isinstance(date_range, (list, tuple)) and len(date_range) == 2:
-            filtered = filtered[(filtered["date"] >= pd.to_datetime(date_range[0])) & (filtered["date"] <= pd.to_datetime(date_range[1]))]
+            date_bounds = (pd.to_datetime(date_range[0]), pd.to_datetime(date_range[1]))
         else:  # fallback single date
-            filtered = filtered[filtered["date"] == pd.to_datetime(date_range)]
+            date_bounds = (pd.to_datetime(date_range), pd.to_datetime(date_range))
 
     # --- Drill Down Controls ---
     st.sidebar.markdown("### Drill Down Controls")
@@ -158,7 +582,6 @@ else:
     if enable_year_drill:
         all_years = sorted(df["year"].unique())
         drill_year = st.sidebar.selectbox("Drill Year", all_years, index=all_years.index(yr_range[1]))
-        filtered = filtered[filtered["year"] == drill_year]
     else:
         drill_year = None
 
@@ -166,49 +589,49 @@ else:
     if enable_country_drill:
         all_ctrs = sorted(df["country"].dropna().unique())
         drill_country = st.sidebar.selectbox("Drill Country", all_ctrs, index=0)
-        filtered = filtered[filtered["country"] == drill_country]
     else:
         drill_country = None
 
-    chart_type = st.sidebar.radio("Trend Chart Type", ["Line", "Bar", "Heatmap"])
+    sel = Selection(tuple(yr_range), tuple(sel_countries), date_bounds, drill_year, drill_country)
+    filtered = select_rows(df, sel)
+
+    chart_type = st.sidebar.radio("Trend Chart Type", CHART_TYPES)
+    approx_first = st.sidebar.checkbox(
+        "Approximate first for large selections",
+        value=True,
+        help="Summarise many countries as a mean with error bounds first, then replace it with per-country charts.",
+    )
 
     extremes = None
     extremes_table = None
-    if os.path.exists("analysis/extremes.csv"):
-        ex = pd.read_csv("analysis/extremes.csv")
-        extremes = ex
-        extremes_table = ex.copy()
-        extremes_table = extremes_table[
-            (extremes_table["year"] >= yr_range[0]) & (extremes_table["year"] <= yr_range[1])
-        ]
-        if sel_countries:
-            extremes_table = extremes_table[extremes_table["country"].isin(sel_countries)]
-        if drill_year is not None:
-            extremes_table = extremes_table[extremes_table["year"] == drill_year]
-        if drill_country is not None:
-            extremes_table = extremes_table[extremes_table["country"] == drill_country]
+    if os.path.exists(EXTREMES_PATH):
+        extremes = pd.read_csv(EXTREMES_PATH)
+        extremes_table = select_extremes(extremes, sel)
+
+    # Figures handed over by the refinement that triggered this rerun; pinned in
+    # the session so they survive eviction from the shared cache.
+    refined = st.session_state.get("refined")
+    exact = refined[1] if refined is not None and refined[0] == (sel, variable, chart_type) else None
+    n_countries = filtered["country"].nunique()
+    preview = False
+    refine = None
+    status = st.empty()
+    if (
+        approx_first
+        and exact is None
+        and n_countries >= APPROX_MIN_TRACES
+        and not exact_ready(cache, sel, variable, chart_type)
+    ):
+        preview = True
+        refine = schedule_refine(df, extremes, cache, sel, variable, chart_type)
+        status.info("Showing a summary preview — computing per-country charts...")
 
     st.markdown("## Average Climate Measures by Country")
     st.markdown(
         "This choropleth map visualizes the average value of the selected variable across the chosen countries and time period."
     )
     if not filtered.empty:
-        country_avg = filtered.groupby("country")[variable].mean().reset_index()
-        fig = px.choropleth(
-            country_avg,
-            locations="country",
-            locationmode="country names",
-            color=variable,
-            title=f"{variable} Average by Country",
-            template="plotly_dark",
-        )
-        fig.update_layout(
-            paper_bgcolor="rgba(0,0,0,0)",
-            plot_bgcolor="rgba(0,0,0,0)",
-            coloraxis_colorbar=dict(title=variable.replace("_", " ").title()),
-            height=600,
-            width=1100,
-        )
+        fig = choropleth_figure(df, cache, sel, variable)
         st.plotly_chart(fig, use_container_width=True)
     else:
         st.info("No data for choropleth.")
@@ -219,73 +642,40 @@ else:
         "Switch between line, bar, and heatmap views."
     )
 
-    if not filtered.empty:
-        if chart_type == "Heatmap":
-            pivot = filtered.pivot_table(
-                index="country", columns="month", values=variable, aggfunc="mean", fill_value=None
-            )
-            fig2 = px.imshow(
-                pivot,
-                labels=dict(x="Month", y="Country", color=variable),
-                aspect="auto",
-                title=f"{variable} Heatmap (Country vs Month)",
-                template="plotly_dark",
-            )
-        else:
-            if chart_type == "Line":
-                fig2 = px.line(
-                    filtered,
-                    x="month",
-                    y=variable,
-                    color="country",
-                    title=f"{variable} Trend Comparison ({yr_range[0]}-{yr_range[1]})",
-                    template="plotly_dark",
-                )
-            elif chart_type == "Bar":
-                fig2 = px.bar(
-                    filtered,
-                    x="month",
-                    y=variable,
-                    color="country",
-                    title=f"{variable} Bar Comparison ({yr_range[0]}-{yr_range[1]})",
-                    template="plotly_dark",
-                )
-
-            if extremes_table is not None and not extremes_table.empty and chart_type in ("Line", "Bar"):
-                for country in sel_countries:
-                    df_ext = extremes_table[extremes_table["country"] == country]
-                    if not df_ext.empty and variable in df_ext.columns:
-                        fig2.add_trace(
-                            go.Scatter(
-                                x=df_ext["month"],
-                                y=df_ext[variable],
-                                mode="markers",
-                                name=f"Extreme ({country})",
-                                marker=dict(color="red", size=12, symbol="x"),
-                                showlegend=True,
-                            )
-                        )
-
+    if preview and chart_type != "Heatmap":
+        # The heatmap is a single trace, so it is drawn exactly even in a preview.
+        fig2 = build_envelope_figure(
+            filtered, "month", variable, chart_type,
+            f"{variable} Across {n_countries} Countries ({yr_range[0]}-{yr_range[1]}) — preview",
+        )
         st.plotly_chart(fig2, use_container_width=True)
-        buf = io.BytesIO()
-        fig2.write_image(buf, format="png")
-        st.download_button(label="Download Chart as PNG", data=buf, file_name="chart.png", mime="image/png")
+        st.caption(
+            f"Preview: mean of the {n_countries} selected countries, with bounds covering the middle "
+            f"{APPROX_BAND[1] - APPROX_BAND[0]:.0%} of countries. Per-country charts and the PNG download follow."
+        )
+    elif not filtered.empty:
+        fig2 = exact["trend"] if exact else trend_chart(df, extremes, cache, sel, variable, chart_type)
+        st.plotly_chart(fig2, use_container_width=True)
+        try:
+            png = trend_png(cache, fig2, sel, variable, chart_type)
+        except Exception as exc:
+            st.caption(f"PNG export unavailable: {exc}")
+        else:
+            st.download_button(label="Download Chart as PNG", data=png, file_name="chart.png", mime="image/png")
     else:
         st.info("No data for selected chart.")
 
     # Time series section (with unique key)
     st.markdown("## Interactive Time Series for Selected Variable")
-    if not filtered.empty:
-        fig_ts = px.line(
-            filtered,
-            x="date",
-            y=variable,
-            color="country",
-            title=f"Time Series of {variable.replace('_', ' ').title()}",
-            template="plotly_dark",
-            markers=True,
+    if preview:
+        fig_ts = build_envelope_figure(
+            filtered, "date", variable, "Line",
+            f"Time Series of {variable.replace('_', ' ').title()} Across {n_countries} Countries — preview",
         )
         st.plotly_chart(fig_ts, use_container_width=True, key="timeseries")
+    elif not filtered.empty:
+        fig_ts = exact["timeseries"] if exact else timeseries_figure(df, cache, sel, variable)
+        st.plotly_chart(fig_ts, use_container_width=True, key="timeseries")
 
     if not filtered.empty:
         csv = filtered.to_csv(index=False).encode("utf-8")
@@ -301,6 +691,35 @@ else:
     else:
         st.info("No extremes for current selection.")
 
+    st.markdown("## Long-Term Trends")
+    st.markdown(
+        "Per-country trend of the selected variable across all years: Sen's slope and least-squares slope per year, "
+        "with Mann-Kendall significance (p < 0.05 marks an increasing or decreasing trend)."
+    )
+    trend_season = st.sidebar.selectbox("Trend Season", TREND_SEASONS)
+    if not os.path.exists(TRENDS_PATH):
+        st.info("Run scripts/compute_trends.py to generate trend statistics.")
+    else:
+        trends = load_trends(TRENDS_PATH, os.path.getmtime(TRENDS_PATH))
+        season_trends = trends[(trends["variable"] == variable) & (trends["season"] == trend_season)]
+        if trends.empty:
+            st.info(
+                "Not enough complete years of data for trend statistics "
+                "(see MIN_YEARS in scripts/compute_trends.py)."
+            )
+        elif season_trends.empty:
+            st.info(f"No trend statistics for {variable} ({trend_season}).")
+        else:
+            st.plotly_chart(build_trend_map(season_trends, variable, trend_season), use_container_width=True)
+            only_significant = st.checkbox("Only significant trends")
+            trend_table = season_trends.drop(columns=["variable", "season"])
+            if only_significant:
+                trend_table = trend_table[trend_table["trend"] != "no trend"]
+            st.dataframe(
+                trend_table.sort_values("sens_slope", ascending=False).reset_index(drop=True),
+                use_container_width=True,
+            )
+
     st.markdown("## Scatter Plot — Relationship Explorer")
     if filtered.empty:
         st.info("No data available for scatter plot.")
@@ -336,6 +755,9 @@ else:
         **Can I download the current chart or filtered data?**  
         Yes! Use the "Download Chart as PNG" or "Download Filtered Data as CSV" buttons below each chart.
 
+        **How are long-term trends computed?**  
+        `scripts/compute_trends.py` averages each variable per country, season and year, then fits a least-squares slope, a Sen's (median pairwise) slope and a Mann-Kendall significance test for every series. Click a table column header to sort.
+
         **What does each variable mean?**  
         - `temperature_celsius`: Monthly average temperature (°C)
         - `precip_mm`: Total monthly precipitation (mm)
@@ -343,6 +765,9 @@ else:
         - `wind_mps`: Monthly average wind speed (meters/sec)
         - ...plus any others present in your data!
         
+        **Why do some charts say "approximate" or "preview"?**  
+        When many countries are selected, the trend and time series charts first show the mean across countries, with a band covering the middle 90% of them. The per-country charts replace the preview automatically; untick "Approximate first for large selections" to always wait for them.
+
         **No data or empty plots?**  
         Try expanding your time range or selecting more countries; some combinations may have missing data.
 
@@ -351,3 +776,15 @@ else:
         
         """
         )
+
+    if refine is not None:
+        # The preview is on screen; rerun onto the exact figures once they land.
+        wait_for_exact(refine, status)
+        if not refine.cancelled():
+            if refine.exception() is None:
+                st.session_state["refined"] = ((sel, variable, chart_type), refine.result())
+                st.rerun()
+            status.warning(f"Exact results could not be computed: {refine.exception()}")
+    else:
+        # Warm the results for the clicks most likely to come next.
+        schedule_prefetch(df, extremes, cache, prefetch_candidates(sel, variable, chart_type, variable_options))
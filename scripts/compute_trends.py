@@ -0,0 +1,134 @@
+import os
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+
+IN_MONTHLY = "data/processed/monthly_agg.parquet"
+OUT_TRENDS = "data/processed/trends.parquet"
+
+TREND_VARS = ["temperature_celsius", "humidity", "precip_mm", "wind_mps"]
+SEASON_OF_MONTH = {12: "DJF", 1: "DJF", 2: "DJF", 3: "MAM", 4: "MAM", 5: "MAM",
+                   6: "JJA", 7: "JJA", 8: "JJA", 9: "SON", 10: "SON", 11: "SON"}
+ANNUAL = "ANN"
+# A season or year only counts when every one of its months is present.
+MONTHS_PER_SEASON = 3
+MONTHS_PER_YEAR = 12
+# Mann-Kendall needs n >= 5 to reach p < 0.05 at all, and its normal
+# approximation is only reasonable from about 8-10 points.
+MIN_YEARS = 8
+ALPHA = 0.05
+TREND_COLUMNS = ["country", "variable", "season", "n_years", "start_year", "end_year",
+                 "ols_slope", "sens_slope", "mk_s", "mk_z", "mk_p", "trend"]
+
+
+def complete_means(m, keys, variables, months):
+    """Mean per group, NaN wherever a variable has fewer than ``months`` monthly values."""
+    grouped = m.groupby(keys)[variables]
+    return grouped.mean().where(grouped.count() == months).reset_index()
+
+
+def yearly_series(m, variables):
+    """One row per (country, variable, season), one column per year.
+
+    Values are the mean of the monthly values in that season and year. Partial
+    seasons and years are NaN, so a May-Dec year is never compared with a full
+    one. December belongs to the following year's DJF, keeping winters continuous.
+    """
+    m = m.copy()
+    month_num = pd.to_datetime(m["month"]).dt.month
+    m["season"] = month_num.map(SEASON_OF_MONTH)
+    m["season_year"] = m["year"] + (month_num == 12).astype(int)
+    seasonal = complete_means(m, ["country", "season", "season_year"], variables, MONTHS_PER_SEASON)
+    seasonal = seasonal.rename(columns={"season_year": "year"})
+    annual = complete_means(m, ["country", "year"], variables, MONTHS_PER_YEAR).assign(season=ANNUAL)
+    long = pd.concat([seasonal, annual]).melt(
+        id_vars=["country", "season", "year"], value_vars=variables, var_name="variable"
+    )
+    return long.pivot_table(index=["country", "variable", "season"], columns="year", values="value", aggfunc="mean")
+
+
+def ols_slopes(years, values):
+    """Least-squares slope per row of ``values`` (series x years), skipping NaNs."""
+    valid = ~np.isnan(values)
+    n = valid.sum(axis=1)
+    x_mean = np.where(valid, years, 0.0).sum(axis=1) / n
+    y_mean = np.where(valid, values, 0.0).sum(axis=1) / n
+    dx = np.where(valid, years - x_mean[:, None], 0.0)
+    dy = np.where(valid, values - y_mean[:, None], 0.0)
+    return (dx * dy).sum(axis=1) / (dx ** 2).sum(axis=1)
+
+
+def sens_slopes(years, values):
+    """Theil-Sen slope per row: median of all pairwise slopes between valid years."""
+    i, j = np.triu_indices(values.shape[1], k=1)
+    pair_slopes = (values[:, j] - values[:, i]) / (years[j] - years[i])
+    return np.nanmedian(pair_slopes, axis=1)
+
+
+def mann_kendall(values):
+    """Mann-Kendall S, tie-corrected Z and two-sided p-value per row."""
+    i, j = np.triu_indices(values.shape[1], k=1)
+    s = np.nansum(np.sign(values[:, j] - values[:, i]), axis=1)
+    n = (~np.isnan(values)).sum(axis=1)
+    # Each value in a tie group of size t adds (t - 1)(2t + 5), so the group adds
+    # t(t - 1)(2t + 5). NaN never equals anything, so missing years drop out.
+    tie_size = (values[:, :, None] == values[:, None, :]).sum(axis=2)
+    tie_term = np.where(tie_size > 0, (tie_size - 1) * (2 * tie_size + 5), 0).sum(axis=1)
+    var_s = (n * (n - 1) * (2 * n + 5) - tie_term) / 18.0
+    sd = np.sqrt(var_s)
+    z = np.divide(s - np.sign(s), sd, out=np.zeros_like(sd), where=sd > 0)
+    p = 2 * stats.norm.sf(np.abs(z))
+    return s, z, p
+
+
+def compute_trends(m, variables):
+    wide = yearly_series(m, variables)
+    values = wide.to_numpy(dtype=float)
+    years = wide.columns.to_numpy(dtype=float)
+    n_years = (~np.isnan(values)).sum(axis=1)
+    keep = n_years >= MIN_YEARS
+    if not keep.any():
+        return pd.DataFrame(columns=TREND_COLUMNS)
+    wide, values, n_years = wide[keep], values[keep], n_years[keep]
+
+    mk_s, mk_z, mk_p = mann_kendall(values)
+    valid = ~np.isnan(values)
+    trends = wide.index.to_frame(index=False)
+    trends["n_years"] = n_years
+    trends["start_year"] = np.where(valid, years, np.inf).min(axis=1).astype(int)
+    trends["end_year"] = np.where(valid, years, -np.inf).max(axis=1).astype(int)
+    trends["ols_slope"] = ols_slopes(years, values)
+    trends["sens_slope"] = sens_slopes(years, values)
+    trends["mk_s"] = mk_s
+    trends["mk_z"] = mk_z
+    trends["mk_p"] = mk_p
+    trends["trend"] = np.where(
+        mk_p >= ALPHA, "no trend", np.where(mk_z > 0, "increasing", "decreasing")
+    )
+    return trends[TREND_COLUMNS]
+
+
+def main():
+    print("Starting trend computation...")
+
+    if not os.path.exists(IN_MONTHLY):
+        print("ERROR: Input file not found. Run aggregation first.")
+        return
+    m = pd.read_parquet(IN_MONTHLY)
+    variables = [v for v in TREND_VARS if v in m.columns]
+    print(f"Loaded monthly data with {len(m)} rows; variables: {variables}")
+
+    trends = compute_trends(m, variables)
+    print(f"Computed trends for {len(trends)} (country, variable, season) series")
+    if len(trends) == 0:
+        # Still written, so the dashboard can tell "too short a record" from "not run".
+        print(f"No series with at least {MIN_YEARS} complete years of data.")
+    else:
+        print(trends["trend"].value_counts().to_string())
+
+    trends.to_parquet(OUT_TRENDS, index=False)
+    print(f"Saved trends to {OUT_TRENDS}, rows: {len(trends)}")
+
+if __name__ == "__main__":
+    main()